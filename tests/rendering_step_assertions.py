@@ -1,56 +1,161 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 import re
-import unittest
+import sys
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    import unittest
 
 
 ROOT = Path(__file__).resolve().parent.parent
 TASKS_DOC = ROOT / "docs" / "rendering_module_tasks.md"
 
+_TASK_HEADER_RE = re.compile(rb"^### `(RND-\d{2}-\d{2})`", re.MULTILINE)
+_TASK_ID_RE = re.compile(r"RND-\d{2}-\d{2}")
+_DOD_LINE_RE = re.compile(rb"\d+\.")
+
+# The tasks doc is ASCII markdown, so it is scanned as bytes to skip decoding.
+DOD_MARKER = b"- Definition of done:"
+DEPS_MARKER = b"- Dependencies:"
+STEP_HEADER = b"## Step "
+FINAL_HEADER = b"## Final Exit Criteria"
+
 
-@dataclass(frozen=True)
-class StepExpectation:
+class StepExpectation(NamedTuple):
     step: str
     task_ids: tuple[str, ...]
 
 
-def load_tasks_doc() -> str:
-    if not TASKS_DOC.exists():
-        raise AssertionError(f"Missing tasks doc: {TASKS_DOC}")
-    return TASKS_DOC.read_text(encoding="utf-8")
+class TaskBlock(NamedTuple):
+    text: bytes
+    dod_lines: int
+
+
+_TaskIndex = tuple[dict[str, dict[str, TaskBlock]], dict[str, frozenset[str]]]
+
+
+def count_dod_lines(task_text: bytes) -> int:
+    lines = iter(task_text.splitlines())
+    for line in lines:
+        if line == DOD_MARKER:
+            break
+    else:
+        return 0
+
+    count = 0
+    for line in lines:
+        if not _DOD_LINE_RE.match(line):
+            break
+        count += 1
+    return count
+
+
+def _index_steps(data: bytes) -> dict[str, tuple[int, int]]:
+    spans: dict[str, tuple[int, int]] = {}
+    offset = 0
+    current: str | None = None
+    current_start = 0
+    for line in data.splitlines(keepends=True):
+        if line.startswith(STEP_HEADER):
+            if current is not None:
+                spans[current] = (current_start, offset)
+            step = line.split(b":", 1)[0].removeprefix(STEP_HEADER).strip()
+            current = step.decode("ascii")
+            current_start = offset + len(line)
+        elif line.startswith(FINAL_HEADER) and current is not None:
+            spans[current] = (current_start, offset)
+            current = None
+        offset += len(line)
+    return spans
+
+
+def _parse_task_blocks(block: bytes) -> dict[str, TaskBlock]:
+    starts: list[int] = []
+    ids: list[str] = []
+    for header in _TASK_HEADER_RE.finditer(block):
+        starts.append(header.start())
+        ids.append(sys.intern(header.group(1).decode("ascii")))
+    starts.append(len(block))
+
+    tasks: dict[str, TaskBlock] = {}
+    for index, task_id in enumerate(ids):
+        text = block[starts[index]:starts[index + 1]]
+        tasks[task_id] = TaskBlock(text=text, dod_lines=count_dod_lines(text))
+    return tasks
+
+
+@lru_cache(maxsize=1)
+def _load_cached(mtime_ns: int) -> _TaskIndex:
+    with open(TASKS_DOC, "rb") as handle:
+        data = handle.read()
+    tasks = {
+        step: _parse_task_blocks(data[start:end])
+        for step, (start, end) in _index_steps(data).items()
+    }
+    present = {step: frozenset(step_tasks) for step, step_tasks in tasks.items()}
+    return tasks, present
+
+
+def _load_task_index() -> _TaskIndex:
+    # Keyed on mtime so edits made while a watcher re-runs the suite are picked up.
+    try:
+        return _load_cached(TASKS_DOC.stat().st_mtime_ns)
+    except FileNotFoundError:
+        raise AssertionError(f"Missing tasks doc: {TASKS_DOC}") from None
+
+
+def load_task_blocks(step: str) -> dict[str, TaskBlock]:
+    tasks = _load_task_index()[0].get(step)
+    if tasks is None:
+        raise AssertionError(f"Could not find step block for step {step}")
+    return tasks
 
 
-def extract_step_block(content: str, step: str) -> str:
-    pattern = rf"## Step {step}:(.*?)(?:\n## Step |\n## Final Exit Criteria)"
-    match = re.search(pattern, content, flags=re.DOTALL)
-    if not match:
+def load_step_task_ids(step: str) -> frozenset[str]:
+    task_ids = _load_task_index()[1].get(step)
+    if task_ids is None:
         raise AssertionError(f"Could not find step block for step {step}")
-    return match.group(1)
+    return task_ids
+
+
+def assert_task_ids_well_formed(
+    testcase: unittest.TestCase,
+    expectations: Iterable[StepExpectation],
+) -> None:
+    malformed = [
+        task_id
+        for expectation in expectations
+        for task_id in expectation.task_ids
+        if not _TASK_ID_RE.fullmatch(task_id)
+    ]
+    testcase.assertFalse(malformed, msg=f"Malformed task ids: {malformed}")
 
 
 def assert_step_tasks(
     testcase: unittest.TestCase,
     expectation: StepExpectation,
 ) -> None:
-    content = load_tasks_doc()
-    block = extract_step_block(content, expectation.step)
+    missing = set(expectation.task_ids) - load_step_task_ids(expectation.step)
+    testcase.assertFalse(
+        missing,
+        msg=f"Missing tasks {sorted(missing)} in step {expectation.step}",
+    )
+    tasks = load_task_blocks(expectation.step)
 
     for task_id in expectation.task_ids:
-        testcase.assertIn(
-            f"`{task_id}`",
-            block,
-            msg=f"Missing task {task_id} in step {expectation.step}",
-        )
-        testcase.assertRegex(
-            block,
-            rf"### `{re.escape(task_id)}`[\s\S]*?- Definition of done:",
+        task_text = tasks[task_id].text
+        testcase.assertNotEqual(
+            task_text.find(DOD_MARKER),
+            -1,
             msg=f"Missing DoD section for task {task_id}",
         )
-        testcase.assertRegex(
-            block,
-            rf"### `{re.escape(task_id)}`[\s\S]*?- Dependencies:",
+        testcase.assertNotEqual(
+            task_text.find(DEPS_MARKER),
+            -1,
             msg=f"Missing dependency section for task {task_id}",
         )
 
@@ -59,16 +164,18 @@ def assert_step_has_three_definition_checks(
     testcase: unittest.TestCase,
     expectation: StepExpectation,
 ) -> None:
-    content = load_tasks_doc()
-    block = extract_step_block(content, expectation.step)
+    tasks = load_task_blocks(expectation.step)
 
     for task_id in expectation.task_ids:
-        task_pattern = rf"### `{re.escape(task_id)}`([\s\S]*?)(?:\n### `RND-|\Z)"
-        task_match = re.search(task_pattern, block)
-        testcase.assertIsNotNone(task_match, msg=f"Missing block for {task_id}")
-        task_block = task_match.group(1)
-
-        dod_match = re.search(r"- Definition of done:\n((?:\d+\..*\n){3,})", task_block)
-        testcase.assertIsNotNone(
-            dod_match, msg=f"Task {task_id} must include at least 3 DoD checks"
+        task = tasks.get(task_id)
+        testcase.assertIsNotNone(task, msg=f"Missing block for {task_id}")
+        testcase.assertGreaterEqual(
+            task.dod_lines,
+            3,
+            msg=f"Task {task_id} must include at least 3 DoD checks",
         )
+
+
+def assert_step(testcase: unittest.TestCase, expectation: StepExpectation) -> None:
+    assert_step_tasks(testcase, expectation)
+    assert_step_has_three_definition_checks(testcase, expectation)
@@ -1,21 +0,0 @@
-import unittest
-
-from rendering_step_assertions import (
-    StepExpectation,
-    assert_step_has_three_definition_checks,
-    assert_step_tasks,
-)
-
-
-class TestRenderingStep01Contracts(unittest.TestCase):
-    def test_step_01_has_required_tasks_and_quality_gates(self) -> None:
-        expectation = StepExpectation(
-            step="1",
-            task_ids=("RND-01-01", "RND-01-02", "RND-01-03", "RND-01-04"),
-        )
-        assert_step_tasks(self, expectation)
-        assert_step_has_three_definition_checks(self, expectation)
-
-
-if __name__ == "__main__":
-    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+
+from rendering_step_assertions import (
+    StepExpectation,
+    assert_step,
+    assert_task_ids_well_formed,
+    count_dod_lines,
+)
+
+
+STEP_EXPECTATIONS = (
+    StepExpectation("1", ("RND-01-01", "RND-01-02", "RND-01-03", "RND-01-04")),
+    StepExpectation("2", ("RND-02-01", "RND-02-02", "RND-02-03")),
+    StepExpectation("3", ("RND-03-01", "RND-03-02", "RND-03-03")),
+    StepExpectation("4", ("RND-04-01", "RND-04-02", "RND-04-03")),
+    StepExpectation("5", ("RND-05-01", "RND-05-02", "RND-05-03")),
+    StepExpectation("6", ("RND-06-01", "RND-06-02", "RND-06-03")),
+    StepExpectation("7", ("RND-07-01", "RND-07-02", "RND-07-03")),
+    StepExpectation("8", ("RND-08-01", "RND-08-02", "RND-08-03")),
+    StepExpectation("9", ("RND-09-01", "RND-09-02", "RND-09-03")),
+    StepExpectation("10", ("RND-10-01", "RND-10-02", "RND-10-03")),
+)
+
+
+class TestRenderingSteps(unittest.TestCase):
+    def test_step_expectations_use_well_formed_task_ids(self) -> None:
+        assert_task_ids_well_formed(self, STEP_EXPECTATIONS)
+
+    def test_steps_have_required_tasks_and_quality_gates(self) -> None:
+        for expectation in STEP_EXPECTATIONS:
+            with self.subTest(step=expectation.step):
+                assert_step(self, expectation)
+
+    def test_dod_lines_are_counted_in_crlf_text(self) -> None:
+        task_text = (
+            b"### `RND-02-01` Task\r\n"
+            b"- Dependencies: none.\r\n"
+            b"- Definition of done:\r\n"
+            b"1. First.\r\n"
+            b"2. Second.\r\n"
+            b"3. Third.\r\n"
+            b"\r\n"
+        )
+        self.assertEqual(count_dod_lines(task_text), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import re
 import unittest
 from pathlib import Path
@@ -6,36 +8,57 @@ from pathlib import Path
 ROOT = Path(__file__).resolve().parent.parent
 UI_MATRIX_DOC = ROOT / "docs" / "testing" / "rendering_ui_test_matrix.md"
 
+REQUIRED_SELECTORS = (
+    '[data-testid="render-canvas"]',
+    '[data-testid="fps-counter"]',
+    '[data-testid="camera-zoom-value"]',
+    '[data-testid="overlay-toggle-path"]',
+    '[data-testid="overlay-toggle-los"]',
+    '[data-testid="debug-picked-tile"]',
+    '[data-testid="debug-picked-entity"]',
+)
+
+_SCENARIO_RE = re.compile(r"UI-RND-(\d{2})")
+_SELECTOR_RE = re.compile(
+    "|".join(re.escape(selector) for selector in REQUIRED_SELECTORS)
+)
+
 
 class TestRenderingUiReadiness(unittest.TestCase):
+    _content: str | None
+    _scenarios: frozenset[str]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        try:
+            cls._content = UI_MATRIX_DOC.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            cls._content = None
+        cls._scenarios = frozenset(_SCENARIO_RE.findall(cls._content or ""))
+
+    def _require_content(self) -> str:
+        if self._content is None:
+            self.fail(f"Missing {UI_MATRIX_DOC}")
+        return self._content
+
     def test_ui_matrix_document_exists(self) -> None:
         self.assertTrue(UI_MATRIX_DOC.exists(), f"Missing {UI_MATRIX_DOC}")
 
     def test_required_test_selectors_declared(self) -> None:
-        content = UI_MATRIX_DOC.read_text(encoding="utf-8")
-        selectors = (
-            '[data-testid="render-canvas"]',
-            '[data-testid="fps-counter"]',
-            '[data-testid="camera-zoom-value"]',
-            '[data-testid="overlay-toggle-path"]',
-            '[data-testid="overlay-toggle-los"]',
-            '[data-testid="debug-picked-tile"]',
-            '[data-testid="debug-picked-entity"]',
-        )
-        for selector in selectors:
-            self.assertIn(selector, content, f"Missing selector contract: {selector}")
+        found = set(_SELECTOR_RE.findall(self._require_content()))
+        missing = set(REQUIRED_SELECTORS) - found
+        self.assertFalse(missing, f"Missing selector contracts: {sorted(missing)}")
 
     def test_ui_scenarios_cover_all_rendering_steps(self) -> None:
-        content = UI_MATRIX_DOC.read_text(encoding="utf-8")
-        scenario_ids = re.findall(r"UI-RND-(\d{2})", content)
+        self._require_content()
         self.assertEqual(
-            len(set(scenario_ids)),
+            len(self._scenarios),
             10,
             "UI matrix must define exactly 10 unique scenarios (UI-RND-01..10)",
         )
 
     def test_ui_validation_rules_are_explicit(self) -> None:
-        content = UI_MATRIX_DOC.read_text(encoding="utf-8")
+        content = self._require_content()
         required_sections = (
             "setup preconditions",
             "test actions",